@@ -3,7 +3,7 @@ set -euo pipefail
 
 ENV_NAME="wellness"
 PY_VER="3.11"
-REQ_PKGS=(streamlit pandas pyyaml plotly)
+REQ_PKGS=(streamlit pandas pyyaml plotly pyarrow tsdownsample orjson)
 
 cd "$(dirname "$0")"
 
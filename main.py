@@ -7,37 +7,129 @@ import yaml
 import plotly.graph_objects as go
 
 from style import apply_ios_style
-from plot_stats import plot_time_series, plot_activity_calendar, plot_exercise_calendar, get_activity_score
+from plot_stats import (
+    plot_time_series,
+    plot_activity_calendar,
+    plot_exercise_calendar,
+    get_activity_score,
+    normalize_wellness_df,
+)
 
 
 # ================= DATA HANDLER ================= #
 
-import os
-from datetime import datetime, timedelta
-import pandas as pd
+
+def _is_parquet(filename: str) -> bool:
+    return filename.endswith(".parquet")
+
+
+def _apply_dtypes(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    # columns whose stored values don't fit the schema stay object, which accepts any value
+    for col, dtype in (dtypes or {}).items():
+        if col in df.columns:
+            try:
+                df[col] = df[col].astype(dtype)
+            except (TypeError, ValueError):
+                df[col] = df[col].astype(object)
+    return df
+
+
+def _read_csv(filename: str, dtypes: dict = None) -> pd.DataFrame:
+    header = pd.read_csv(filename, nrows=0).columns
+    parse_dates = ["timestamp"] if "timestamp" in header else None
+    kwargs = dict(parse_dates=parse_dates, date_format="ISO8601")
+    if dtypes:
+        try:
+            # typed read: skips per-column type inference
+            return pd.read_csv(filename, dtype={c: t for c, t in dtypes.items() if c in header}, **kwargs)
+        except (TypeError, ValueError):
+            # legacy cells that don't parse as the schema type: coerce column by column
+            return _apply_dtypes(pd.read_csv(filename, **kwargs), dtypes)
+    return pd.read_csv(filename, **kwargs)
+
+
+def _parquet_safe(df: pd.DataFrame) -> pd.DataFrame:
+    # Parquet columns hold a single type; store mixed object columns as text, like the CSV does
+    mixed = [c for c in df.columns[df.dtypes == object] if df[c].dropna().map(type).nunique() > 1]
+    if mixed:
+        df = df.astype({c: "string" for c in mixed})
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _load_cached(filename: str, mtime: float, dtypes: dict = None) -> pd.DataFrame:
+    # mtime is part of the cache key: every save bumps it, so no explicit invalidation is needed;
+    # max_entries evicts the superseded copies of the dataset those saves leave behind
+    if _is_parquet(filename):
+        # columnar and typed: timestamp comes back as datetime64 without any parsing.
+        # Columns _parquet_safe stored as text are put back to the schema (or object) here.
+        df = _apply_dtypes(pd.read_parquet(filename), dtypes)
+    else:
+        df = _read_csv(filename, dtypes)
+    df = WellnessDataHandler._ensure_date_column(df)
+    # index by day so per-date lookups hash instead of scanning; "date" stays a column for writing
+    df.index = pd.Index(df["date"].to_numpy())
+    # newest first, the order the history view renders in; paid once per file version
+    return df.sort_index(ascending=False)
 
 
 class WellnessDataHandler:
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, dtypes: dict = None):
         self.filename = filename
+        self.dtypes = dtypes or {}
+        if _is_parquet(filename):
+            self._migrate_csv()
+
+    def _migrate_csv(self):
+        # one-shot: convert a legacy CSV sitting next to the configured Parquet file
+        legacy = os.path.splitext(self.filename)[0] + ".csv"
+        if not os.path.exists(self.filename) and os.path.exists(legacy):
+            self.save_data(_read_csv(legacy, self.dtypes))
+
+    def data_version(self) -> float:
+        # changes on every save (rewrite or append); used as a cache key for derived data
+        return os.path.getmtime(self.filename) if os.path.exists(self.filename) else 0.0
 
     def load_data(self) -> pd.DataFrame:
         if not os.path.exists(self.filename):
             return pd.DataFrame()
-        df = pd.read_csv(self.filename)
-        if "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
-        return df
+        return _load_cached(self.filename, self.data_version(), self.dtypes)
 
     def save_data(self, df: pd.DataFrame):
         folder = os.path.dirname(self.filename) or "."
         os.makedirs(folder, exist_ok=True)
-        df.to_csv(self.filename, index=False)
+        # on disk rows stay in chronological order, whatever order they were loaded in
+        df = df.sort_index()
+        if _is_parquet(self.filename):
+            _parquet_safe(df).to_parquet(self.filename, index=False)
+        else:
+            df.to_csv(self.filename, index=False)
+
+    def append_row(self, row: dict, columns) -> None:
+        # columns must be the file's header so the new line lines up with it
+        self._typed_frame([row]).reindex(columns=columns).to_csv(
+            self.filename, mode="a", header=False, index=False
+        )
 
-    def _ensure_date_column(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _typed_frame(self, rows: list) -> pd.DataFrame:
+        # cast UI values (e.g. datetime.time) to the column schema before they meet typed columns
+        return _apply_dtypes(pd.DataFrame(rows), self.dtypes)
+
+    def _read_header(self):
+        # Parquet files cannot be appended to, so they always take the rewrite path
+        if _is_parquet(self.filename) or not os.path.exists(self.filename):
+            return None
+        return list(pd.read_csv(self.filename, nrows=0).columns)
+
+    @staticmethod
+    def _ensure_date_column(df: pd.DataFrame) -> pd.DataFrame:
+        # load_data() already derives "date", so this is a no-op on the hot path
         if "date" not in df.columns:
             if "timestamp" in df.columns:
-                df["date"] = pd.to_datetime(df["timestamp"]).dt.strftime("%Y-%m-%d")
+                ts = df["timestamp"]
+                if not pd.api.types.is_datetime64_any_dtype(ts):
+                    ts = pd.to_datetime(ts)
+                df["date"] = ts.dt.strftime("%Y-%m-%d")
             else:
                 df["date"] = pd.NaT
         return df
@@ -45,19 +137,31 @@ class WellnessDataHandler:
     def upsert_for_date(self, day_str: str, updates: dict):
         df = self.load_data()
         df = self._ensure_date_column(df)
-        entry_date = dt.datetime.strptime(day_str, "%Y-%m-%d")
-
-        mask = df["date"] == day_str
+        entry_date = dt.datetime.fromisoformat(day_str)
 
-        if not mask.any():
+        if day_str not in df.index:
             row = {"date": day_str, "timestamp": entry_date}
             row.update(updates)
-            df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
+            header = self._read_header()
+            if header is not None and set(row) <= set(header):
+                # new day with known fields: write one line instead of the whole history
+                self.append_row(row, header)
+                return
+            new_cols = [k for k in row if k not in df.columns]
+            if new_cols:
+                df = df.reindex(columns=[*df.columns, *new_cols])
+            # enlarge in place rather than concat-copying every column;
+            # an object Series lets pandas upcast columns like concat did
+            df.loc[day_str] = self._typed_frame([row]).iloc[0].astype(object)
         else:
-            idx = df[mask].index[0]
-            for k, v in updates.items():
-                df.loc[idx, k] = v
-            df.loc[idx, "timestamp"] = entry_date
+            for k, v in self._typed_frame([updates]).iloc[0].items():
+                try:
+                    df.loc[day_str, k] = v
+                except (TypeError, ValueError):
+                    # stored column can't hold v (e.g. legacy text left in a numeric field)
+                    df[k] = df[k].astype(object)
+                    df.loc[day_str, k] = v
+            df.loc[day_str, "timestamp"] = entry_date
 
         self.save_data(df)
 
@@ -66,65 +170,122 @@ class WellnessDataHandler:
         df = self.load_data()
         if df.empty:
             return {}
-        df = self._ensure_date_column(df)
-        row = df[df["date"] == day_str]
-        if row.empty:
+        if day_str not in df.index:
             return {}
-        return row.iloc[0].to_dict()
+        return df.loc[[day_str]].iloc[0].to_dict()
 
 
 # ================= HELPERS ================= #
 
 
+# Subjective ratings averaged into the "Overall Vibe": higher-is-better ones count as is,
+# lower-is-better ones as (10 - value)
+_SUBJECTIVE_POS = ("motivation", "mental_clarity", "mood_content", "productivity")
+_SUBJECTIVE_NEG = ("fatigue", "stress", "overstimulation")
+_SUBJECTIVE_N = len(_SUBJECTIVE_POS) + len(_SUBJECTIVE_NEG)
+
+
+def compute_subjective_average(df: pd.DataFrame) -> pd.Series:
+    """Overall Vibe of every row of df; NaN where a rating is missing or unparseable."""
+    pos, neg = list(_SUBJECTIVE_POS), list(_SUBJECTIVE_NEG)
+    if not set(pos + neg).issubset(df.columns):
+        return pd.Series(float("nan"), index=df.index)
+    vals = df[pos + neg].apply(pd.to_numeric, errors="coerce")
+    # min_count makes a row NaN as soon as one rating is missing
+    score = (
+        vals[pos].sum(axis=1, min_count=len(pos))
+        + 10.0 * len(neg)
+        - vals[neg].sum(axis=1, min_count=len(neg))
+    ) / _SUBJECTIVE_N
+    return score.round(1)
+
+
 def get_subjective_average(entry) -> float:
+    """Single-entry form of compute_subjective_average()."""
     try:
-        score = (
-            float(entry["motivation"])
-            + float(entry["mental_clarity"])
-            + float(entry["mood_content"])
-            + float(entry["productivity"])
-            + (10.0 - float(entry["fatigue"]))
-            + (10.0 - float(entry["stress"]))
-            + (10.0 - float(entry["overstimulation"]))
-        ) / 7.0
-        return round(score, 1)
+        return float(compute_subjective_average(pd.DataFrame([entry])).iloc[0])
     except Exception:
         return float("nan")
 
 
+def _is_missing(v) -> bool:
+    # scalar stand-in for pd.isna: None, NaN, pd.NA and NaT are all "not stored"
+    return v is None or v is pd.NA or v is pd.NaT or (isinstance(v, float) and v != v)
+
+
 def get_or_default(d: dict, key: str, default):
     v = d.get(key, default)
-    try:
-        if pd.isna(v):
-            return default
-    except Exception:
-        pass
-    return v
+    return default if _is_missing(v) else v
 
 
 def get_entry_day() -> str:
-    return dt.datetime.now().strftime("%Y-%m-%d")
+    return dt.date.today().isoformat()
 
 def shift_day(day_str: str, delta: int) -> str:
-    d = dt.datetime.strptime(day_str, "%Y-%m-%d")
-    return (d + dt.timedelta(days=delta)).strftime("%Y-%m-%d")
+    # fromisoformat/isoformat are C fast paths for the fixed YYYY-MM-DD format
+    d = dt.date.fromisoformat(day_str)
+    return (d + dt.timedelta(days=delta)).isoformat()
 
 
-def load_config(path: str = "config.yaml") -> dict:
+# libyaml's C loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _load_config_cached(path: str, mtime: float) -> dict:
     with open(path, "r") as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAML_LOADER)
+    # option -> position lookup for select fields, built once per config version
+    # instead of options.index() per render
+    for block in config["blocks"]:
+        for field in block["fields"]:
+            if field["type"] == "select":
+                field["_opt_index"] = {opt: i for i, opt in enumerate(field.get("options", []))}
+    return config
+
+
+def load_config(path: str = "config.yaml") -> dict:
+    # keyed on mtime so edits to the YAML still show up on the next rerun
+    return _load_config_cached(path, os.path.getmtime(path))
+
+
+# Storage dtype per field type; numbers are float64 so blank (None) entries fit as NaN
+_FIELD_DTYPES = {
+    "number": "float64",
+    "slider": "float64",
+    "checkbox": "boolean",
+    "select": "string",
+    "text": "string",
+    "textarea": "string",
+    "time": "string",
+}
+
+
+def build_dtype_map(blocks_conf: list) -> dict:
+    dtypes = {"date": "string"}
+    for block in blocks_conf:
+        for field in block["fields"]:
+            dtype = _FIELD_DTYPES.get(field["type"])
+            if dtype is not None:
+                dtypes[field["name"]] = dtype
+    return dtypes
+
+# string spellings treated as "no value" / as a ticked checkbox
+_EMPTY_STRINGS = frozenset({"", "none", "nan"})
+_TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y"})
+
 
 def cast_initial_value(field: dict, stored):
     t = field["type"]
     default = field.get("default")
 
-    # Prefer stored value; fall back to default from config
-    v = stored if stored is not None else default
+    # Prefer stored value; fall back to default from config (NaN cells count as not stored)
+    v = default if _is_missing(stored) else stored
 
     if t == "number":
         subtype = field.get("subtype", "float")
         # treat special "empty" values as None
-        if v is None or (isinstance(v, str) and v.strip().lower() in {"", "none", "nan"}):
+        if v is None or (isinstance(v, str) and v.strip().lower() in _EMPTY_STRINGS):
             return None
         try:
             return int(v) if subtype == "int" else float(v)
@@ -132,15 +293,10 @@ def cast_initial_value(field: dict, stored):
             return None
 
     if t == "checkbox":
-        if v is None:
+        if _is_missing(v):
             return bool(default)
-        try:
-            if pd.isna(v):
-                return bool(default)
-        except Exception:
-            pass
         if isinstance(v, str):
-            return v.strip().lower() in {"1", "true", "t", "yes", "y"}
+            return v.strip().lower() in _TRUE_STRINGS
         return bool(v)
 
     if t == "select":
@@ -151,7 +307,7 @@ def cast_initial_value(field: dict, stored):
 
     if t == "slider":
         # slider always needs a numeric value for UI
-        if v is None or (isinstance(v, str) and v.strip().lower() in {"", "none", "nan"}):
+        if v is None or (isinstance(v, str) and v.strip().lower() in _EMPTY_STRINGS):
             # fall back to default, then min, then 0
             v = field.get("default", field.get("min", 0))
         try:
@@ -166,7 +322,7 @@ def cast_initial_value(field: dict, stored):
     if t == "time":
         if isinstance(v, str) and v != "now":
             try:
-                return dt.datetime.strptime(v, "%H:%M:%S").time()
+                return dt.time.fromisoformat(v)
             except Exception:
                 pass
         return datetime.now().time()
@@ -231,9 +387,7 @@ def render_field(field: dict, col, today_data: dict, block_id: str, day_str: str
 
     if ftype == "select":
         options = field.get("options", [])
-        index = 0
-        if init in options:
-            index = options.index(init)
+        index = field.get("_opt_index", {}).get(init, 0)
         return col.selectbox(label, options, index=index, key=key)
 
     if ftype == "slider":
@@ -258,17 +412,104 @@ def render_field(field: dict, col, today_data: dict, block_id: str, day_str: str
     return col.text_input(label, value=str(init), key=key)
 
 
+# ================= CACHED PLOTS ================= #
+
+# Figures depend only on the data version and the plot parameters, so the frame is passed
+# as _df (Streamlit skips hashing underscore arguments). cache_resource hands back the
+# built figure itself: st.plotly_chart only reads it, and a cache_data pickle round trip
+# would rebuild and re-validate the whole figure on every hit.
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_plot_frame(_df: pd.DataFrame, data_version: float) -> pd.DataFrame:
+    # parsed dates and float32 metrics, shared read-only by every plot of this data version
+    return normalize_wellness_df(_df)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _cached_time_series(_df: pd.DataFrame, data_version: float, column: str, period: str, title: str, today: str):
+    # today is part of the key because the "last week/month/year" window ends there
+    return plot_time_series(
+        _df, column, period=period, title=title, today=dt.date.fromisoformat(today), date_col_parsed=True
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _cached_exercise_calendar(
+    _df: pd.DataFrame,
+    data_version: float,
+    column: str,
+    period: str,
+    title: str,
+    year: int = None,
+    month: int = None,
+    week_start_date=None,
+):
+    return plot_exercise_calendar(
+        _df, column, period=period, year=year, month=month, week_start_date=week_start_date, title=title
+    )
+
+
 # ================= UI CONSTRUCTOR CLASS ================= #
 
 
+HISTORY_PAGE_SIZE = 30  # history cards rendered per "Show more" step
+
+# Static CSS, built once at import. It is still emitted on every run: Streamlit drops
+# elements a rerun doesn't re-create, so injecting it only once would lose the styles.
+_DAY_PLAQUE_CSS = """
+<style>
+.day-plaque{
+    border:1px solid rgba(0,120,255,.35);
+    border-radius:16px;
+    padding:12px 14px;
+    background:linear-gradient(180deg, rgba(0,120,255,.14), rgba(0,120,255,.06));
+    box-shadow:0 2px 8px rgba(0,80,200,.12);
+    text-align:center;
+    line-height:1.15;
+}
+.day-plaque .kicker{font-size:12px; opacity:.75; margin-bottom:6px; color:rgba(0,70,170,.9);}
+.day-plaque .big{font-size:24px; font-weight:800; color:rgba(0,60,150,.98);}
+.day-plaque .sub{font-size:16px; font-weight:700; margin-top:8px; color:rgba(0,80,200,.95);}
+.day-plaque .sub span{font-weight:900;}
+</style>
+"""
+
+_STATS_CSS = """
+<style>
+.stSelectbox > label {
+    font-weight: 600;
+}
+.stSelectbox [data-baseweb="select"] {
+    border: 2px solid #3498db !important;
+    border-radius: 6px !important;
+    background-color: white !important;
+}
+.stSelectbox [data-baseweb="select"] > div {
+    background-color: white !important;
+    border: 2px solid #3498db !important;
+}
+.stButton > button {
+    height: 2.5rem;
+    width: 100%;
+}
+[data-testid="column"] {
+    display: flex;
+    align-items: flex-start;
+}
+</style>
+"""
+
+
 class WellnessApp:
     def __init__(self, config_path: str = "config.yaml"):
         self.config = load_config(config_path)
         self.app_conf = self.config["app"]
         self.blocks_conf = self.config["blocks"]
 
-        data_file = self.app_conf.get("data_file", "./wellness_data.csv")
-        self.handler = WellnessDataHandler(data_file)
+        data_file = self.app_conf.get("data_file", "./wellness_data.parquet")
+        self._dtypes = build_dtype_map(self.blocks_conf)
+        self.handler = WellnessDataHandler(data_file, dtypes=self._dtypes)
 
     def setup_page(self):
         st.set_page_config(
@@ -330,23 +571,7 @@ class WellnessApp:
         day = st.session_state.entry_day
         today = get_entry_day()
 
-        st.markdown("""
-        <style>
-        .day-plaque{
-            border:1px solid rgba(0,120,255,.35);
-            border-radius:16px;
-            padding:12px 14px;
-            background:linear-gradient(180deg, rgba(0,120,255,.14), rgba(0,120,255,.06));
-            box-shadow:0 2px 8px rgba(0,80,200,.12);
-            text-align:center;
-            line-height:1.15;
-        }
-        .day-plaque .kicker{font-size:12px; opacity:.75; margin-bottom:6px; color:rgba(0,70,170,.9);}
-        .day-plaque .big{font-size:24px; font-weight:800; color:rgba(0,60,150,.98);}
-        .day-plaque .sub{font-size:16px; font-weight:700; margin-top:8px; color:rgba(0,80,200,.95);}
-        .day-plaque .sub span{font-weight:900;}
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_DAY_PLAQUE_CSS, unsafe_allow_html=True)
 
         c0, c1, c2 = st.columns([1, 3, 1])
 
@@ -381,14 +606,15 @@ class WellnessApp:
             return
 
         df = self.handler._ensure_date_column(df)
-        df_display = df.sort_values(by="timestamp", ascending=False)
+        history_n = st.session_state.setdefault("history_n", HISTORY_PAGE_SIZE)
+        df_display = df.head(history_n)  # load_data() already sorts newest first
+        avg_scores = compute_subjective_average(df_display)
 
-        for _, row in df_display.iterrows():
-            ts = row.get("timestamp", None)
-            if pd.isna(ts):
+        for row, avg_score in zip(df_display.itertuples(index=False), avg_scores):
+            ts = getattr(row, "timestamp", None)
+            if _is_missing(ts):
                 continue
             ts_str = ts.strftime("%Y-%m-%d")
-            avg_score = get_subjective_average(row)
 
             with st.container():
                 st.subheader(f"📅 {ts_str}")
@@ -396,49 +622,36 @@ class WellnessApp:
                     st.metric("Overall Vibe", f"{avg_score}/10")
                 st.markdown(
                     f"""
-                    **Sleep:** {row.get('sleep_hours', '–')}h (Q: {row.get('sleep_quality', '–')})  
-                    **Glucose:** {row.get('fasting_glucose', '–')} | **HRV:** {row.get('hrv', '–')}  
-                    **Exercise:** gym={row.get('gym', 0)}, run={row.get('run_km', 0)} km  
-                    **Steps:** {row.get('walking_steps', '–')}  
+                    **Sleep:** {getattr(row, 'sleep_hours', '–')}h (Q: {getattr(row, 'sleep_quality', '–')})  
+                    **Glucose:** {getattr(row, 'fasting_glucose', '–')} | **HRV:** {getattr(row, 'hrv', '–')}  
+                    **Exercise:** gym={getattr(row, 'gym', 0)}, run={getattr(row, 'run_km', 0)} km  
+                    **Steps:** {getattr(row, 'walking_steps', '–')}  
                     """
                 )
 
+        if len(df) > history_n:
+            # callback runs before the rerun, so the next render already shows the extra rows
+            st.button("Show more", key="history_more", on_click=self._show_more_history)
+
+    @staticmethod
+    def _show_more_history():
+        st.session_state.history_n += HISTORY_PAGE_SIZE
+
     def render_stats_tab(self):
         st.header("Stats")
         
         # Add custom CSS for better styling
-        st.markdown("""
-        <style>
-        .stSelectbox > label {
-            font-weight: 600;
-        }
-        .stSelectbox [data-baseweb="select"] {
-            border: 2px solid #3498db !important;
-            border-radius: 6px !important;
-            background-color: white !important;
-        }
-        .stSelectbox [data-baseweb="select"] > div {
-            background-color: white !important;
-            border: 2px solid #3498db !important;
-        }
-        .stButton > button {
-            height: 2.5rem;
-            width: 100%;
-        }
-        [data-testid="column"] {
-            display: flex;
-            align-items: flex-start;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_STATS_CSS, unsafe_allow_html=True)
         
         df = self.handler.load_data()
         if df.empty:
             st.info("No data available yet.")
             return
+        data_version = self.handler.data_version()
         
         # Ensure date column is properly formatted
         df = self.handler._ensure_date_column(df)
+        plot_df = _cached_plot_frame(df, data_version)
         
         # Get stats configuration
         stats_conf = self.config.get("stats", [])
@@ -472,11 +685,13 @@ class WellnessApp:
                     key=f"{stat_id}_period"
                 )
                 
-                fig = plot_time_series(
-                    df,
+                fig = _cached_time_series(
+                    plot_df,
+                    data_version,
                     column,
                     period=period,
-                    title=description
+                    title=description,
+                    today=get_entry_day(),
                 )
                 st.plotly_chart(fig, use_container_width=True, key=f"{stat_id}_plot")
             
@@ -496,72 +711,45 @@ class WellnessApp:
                 if state_week_key not in st.session_state:
                     st.session_state[state_week_key] = today - timedelta(days=today.weekday())
                 
-                # Period selector with radio buttons
-                col1, col2, col3, col4 = st.columns([1.2, 1.2, 1.2, 3])
+                # Period selector: one segmented control instead of three buttons
+                col1, col2 = st.columns([3.6, 3])
                 
                 with col1:
-                    if st.button("Week", key=f"{stat_id}_week", use_container_width=True):
-                        period = "week"
-                        st.session_state[f"{stat_id}_selected_period"] = "week"
+                    period = st.segmented_control(
+                        "View",
+                        options=["week", "month", "year"],
+                        default="month",
+                        format_func=str.capitalize,
+                        key=f"{stat_id}_period_sc",
+                        label_visibility="collapsed",
+                        required=True,  # clicking the active segment keeps it selected
+                    )
                 
+                # Navigation mutates session state in on_click callbacks, which run before
+                # the rerun, so no extra st.rerun() pass is needed
                 with col2:
-                    if st.button("Month", key=f"{stat_id}_month", use_container_width=True):
-                        period = "month"
-                        st.session_state[f"{stat_id}_selected_period"] = "month"
-                
-                with col3:
-                    if st.button("Year", key=f"{stat_id}_year", use_container_width=True):
-                        period = "year"
-                        st.session_state[f"{stat_id}_selected_period"] = "year"
-                
-                # Get current period from session state (default to month)
-                period = st.session_state.get(f"{stat_id}_selected_period", "month")
-                
-                with col4:
                     nav_cols = st.columns(3, gap="small")
-                    
-                    with nav_cols[0]:
-                        if st.button("← Prev", key=f"{stat_id}_prev", use_container_width=True):
-                            if period == "month":
-                                if st.session_state[state_month_key] == 1:
-                                    st.session_state[state_month_key] = 12
-                                    st.session_state[state_year_key] -= 1
-                                else:
-                                    st.session_state[state_month_key] -= 1
-                            elif period == "week":
-                                st.session_state[state_week_key] -= timedelta(days=7)
-                            elif period == "year":
-                                st.session_state[state_year_key] -= 1
-                            st.rerun()
-                    
-                    with nav_cols[1]:
-                        if st.button("◆ Cur", key=f"{stat_id}_current", use_container_width=True):
-                            st.session_state[state_year_key] = today.year
-                            st.session_state[state_month_key] = today.month
-                            st.session_state[state_week_key] = today - timedelta(days=today.weekday())
-                            st.rerun()
-                    
-                    with nav_cols[2]:
-                        if st.button("Next →", key=f"{stat_id}_next", use_container_width=True):
-                            if period == "month":
-                                if st.session_state[state_month_key] == 12:
-                                    st.session_state[state_month_key] = 1
-                                    st.session_state[state_year_key] += 1
-                                else:
-                                    st.session_state[state_month_key] += 1
-                            elif period == "week":
-                                st.session_state[state_week_key] += timedelta(days=7)
-                            elif period == "year":
-                                st.session_state[state_year_key] += 1
-                            st.rerun()
+                    nav_cols[0].button(
+                        "← Prev", key=f"{stat_id}_prev", use_container_width=True,
+                        on_click=self._step_calendar, args=(stat_id, period, -1),
+                    )
+                    nav_cols[1].button(
+                        "◆ Cur", key=f"{stat_id}_current", use_container_width=True,
+                        on_click=self._reset_calendar, args=(stat_id,),
+                    )
+                    nav_cols[2].button(
+                        "Next →", key=f"{stat_id}_next", use_container_width=True,
+                        on_click=self._step_calendar, args=(stat_id, period, 1),
+                    )
                 
                 # Determine period title
                 if period == "month":
                     import calendar as cal
                     month_name = cal.month_name[st.session_state[state_month_key]]
                     period_title = f"{month_name} {st.session_state[state_year_key]}"
-                    fig = plot_exercise_calendar(
-                        df,
+                    fig = _cached_exercise_calendar(
+                        plot_df,
+                        data_version,
                         column,
                         period="month",
                         year=st.session_state[state_year_key],
@@ -572,8 +760,9 @@ class WellnessApp:
                     week_number = st.session_state[state_week_key].isocalendar()[1]
                     week_year = st.session_state[state_week_key].isocalendar()[0]
                     period_title = f"Week {week_number} {week_year}"
-                    fig = plot_exercise_calendar(
-                        df,
+                    fig = _cached_exercise_calendar(
+                        plot_df,
+                        data_version,
                         column,
                         period="week",
                         week_start_date=st.session_state[state_week_key],
@@ -581,8 +770,9 @@ class WellnessApp:
                     )
                 else:  # year
                     period_title = f"{st.session_state[state_year_key]}"
-                    fig = plot_exercise_calendar(
-                        df,
+                    fig = _cached_exercise_calendar(
+                        plot_df,
+                        data_version,
                         column,
                         period="year",
                         year=st.session_state[state_year_key],
@@ -593,6 +783,31 @@ class WellnessApp:
                 st.plotly_chart(fig, use_container_width=True, key=f"{stat_id}_calendar")
 
 
+    @staticmethod
+    def _step_calendar(stat_id: str, period: str, step: int):
+        state_year_key = f"{stat_id}_calendar_year"
+        state_month_key = f"{stat_id}_calendar_month"
+        state_week_key = f"{stat_id}_calendar_week_start"
+        if period == "month":
+            month = st.session_state[state_month_key] + step
+            if month < 1:
+                month, st.session_state[state_year_key] = 12, st.session_state[state_year_key] - 1
+            elif month > 12:
+                month, st.session_state[state_year_key] = 1, st.session_state[state_year_key] + 1
+            st.session_state[state_month_key] = month
+        elif period == "week":
+            st.session_state[state_week_key] += timedelta(days=7 * step)
+        elif period == "year":
+            st.session_state[state_year_key] += step
+
+    @staticmethod
+    def _reset_calendar(stat_id: str):
+        today = datetime.now().date()
+        st.session_state[f"{stat_id}_calendar_year"] = today.year
+        st.session_state[f"{stat_id}_calendar_month"] = today.month
+        st.session_state[f"{stat_id}_calendar_week_start"] = today - timedelta(days=today.weekday())
+
+
 # ================= ENTRY POINT ================= #
 
 
@@ -8,12 +8,144 @@ Provides two main plotting functions:
 
 import datetime as dt
 import typing as T
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 import streamlit as st
 
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:  # optional dependency; fall back to the plain numpy LTTB below
+    MinMaxLTTBDownsampler = None
+
+
+MAX_PLOT_POINTS = 500  # per trace; longer series are downsampled before reaching the browser
+
+WEBGL_MIN_POINTS = 300  # traces at least this long render with scattergl (year views)
+
+_PERIOD_DAYS = {"week": 7, "month": 30, "year": 365}  # look-back window; anything else means a month
+
+_EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()  # datetime64[D] zero as a date.toordinal()
+
+_THRESHOLD_COLORS = {"Negative": "#FF6B6B", "Positive": "#51CF66"}
+
+_DAY_CATEGORY = pd.CategoricalDtype(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"], ordered=True
+)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the series' shape."""
+    n = len(y)
+    # first and last points are always kept; the rest is split into n_out - 2 buckets
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        next_hi = bounds[i + 2] if i + 2 < len(bounds) else n
+        avg_x, avg_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        # pick the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+def _downsample(x: pd.Series, y: pd.Series, n_out: int) -> T.Tuple[pd.Series, pd.Series]:
+    """Reduce (x, y) to about n_out points that keep the visual shape of the series."""
+    if len(y) <= n_out:
+        return x, y
+    mask = y.notna().to_numpy()
+    x, y = x[mask], y[mask]
+    if len(y) <= n_out:
+        return x, y
+    x_values = x.to_numpy().astype("datetime64[ns]").view(np.int64)
+    y_values = y.to_numpy(dtype=np.float32)
+    if MinMaxLTTBDownsampler is not None:
+        idx = MinMaxLTTBDownsampler().downsample(x_values, y_values, n_out=n_out).astype(np.intp)
+    else:
+        idx = _lttb_indices(x_values.astype(np.float64), y_values, n_out)
+    return x.iloc[idx], y.iloc[idx]
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """Parse a YYYY-MM-DD date column; unparseable values become NaT."""
+    # an explicit ISO format keeps pandas on its C parser instead of guessing per value
+    return pd.to_datetime(values, format="ISO8601", errors="coerce", cache=True)
+
+
+def normalize_wellness_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Plot-ready copy of a wellness frame: 'date' parsed to datetime64 and float
+    metric columns narrowed to float32.
+    
+    Meant to be built once per data version and handed to the plot functions
+    with date_col_parsed=True, so they skip re-parsing on every call.
+    """
+    columns = {c: df[c].astype(np.float32) for c in df.select_dtypes(include="float64").columns}
+    if "date" in df.columns:
+        columns["date"] = _parse_dates(df["date"])
+    return df.assign(**columns)
+
+
+def _build_figure(data: T.List[dict], layout: dict) -> go.Figure:
+    """Build a figure from plain trace/layout dicts in one validation pass."""
+    return go.Figure(dict(data=data, layout=layout))
+
+
+def prepare_plot_frame(
+    df: pd.DataFrame,
+    column: str,
+    period: T.Literal["week", "month", "year"] = "month",
+    *,
+    today: T.Optional[dt.date] = None,
+    date_col_parsed: bool = False,
+) -> pd.DataFrame:
+    """
+    The 'date', float32 `column` and weekday ('day') values of the rows dated within the
+    look-back window of `period` ending at `today`, in date order. Only these columns are built.
+
+    The result can be passed as `prepared=` to both plot_time_series and
+    plot_activity_calendar, so a dashboard showing both parses and filters the data once.
+    Expects df to have 'date' and `column` columns.
+    """
+    if today is None:
+        today = dt.datetime.now().date()
+    dates = df["date"] if date_col_parsed else _parse_dates(df["date"])
+    start_date = today - dt.timedelta(days=_PERIOD_DAYS.get(period, 30))
+    # Sort by date once; the period is then a contiguous run found by binary search.
+    # numpy sorts NaT last, so unparseable dates fall past the end of the run.
+    date_values = dates.to_numpy()
+    order = np.argsort(date_values, kind="stable")
+    sorted_dates = date_values[order]
+    first = np.searchsorted(sorted_dates, np.datetime64(start_date, "D"))
+    rows = order[first:len(sorted_dates) - np.isnat(sorted_dates).sum()]
+    period_dates = dates.iloc[rows]
+    return pd.DataFrame({
+        "date": period_dates,
+        column: pd.to_numeric(df[column].iloc[rows], errors="coerce").astype(np.float32, copy=False),
+        "day": pd.Categorical.from_codes(period_dates.dt.weekday.to_numpy(), dtype=_DAY_CATEGORY),
+    })
+
+
+def _scatter_type(n_points: int) -> str:
+    """WebGL scatter for dense traces, SVG otherwise (browsers cap live WebGL contexts per page)."""
+    return "scattergl" if n_points >= WEBGL_MIN_POINTS else "scatter"
+
+
+@lru_cache(maxsize=16)
+def _message_layout(text: str) -> dict:
+    """Layout of an empty figure carrying a single annotation, for the no-data cases."""
+    return dict(annotations=[dict(text=text)])
+
+
+def _message_figure(text: str) -> go.Figure:
+    """A new figure per call, since callers may update it; go.Figure copies the shared layout."""
+    return _build_figure([], _message_layout(text))
+
 
 def plot_time_series(
     df: pd.DataFrame,
@@ -22,6 +154,11 @@ def plot_time_series(
     title: str = None,
     enable_zoom: bool = False,
     zoom_level: float = 1.0,
+    max_points: int = MAX_PLOT_POINTS,
+    *,
+    today: T.Optional[dt.date] = None,
+    date_col_parsed: bool = False,
+    prepared: T.Optional[pd.DataFrame] = None,
 ) -> go.Figure:
     """
     Plot a time series for a single metric over a specified period.
@@ -33,85 +170,66 @@ def plot_time_series(
         title: Optional custom title
         enable_zoom: If True, adds zoom in/out buttons for y-axis (deprecated, use zoom_level instead)
         zoom_level: Zoom factor for y-axis (1.0 = default, 0.5 = 2x zoom in, 2.0 = 2x zoom out)
+        max_points: Maximum points sent per trace; longer series are downsampled (LTTB)
+        today: End of the plotted window (defaults to the current date)
+        date_col_parsed: Set if df['date'] is already datetime64, to skip re-parsing it
+        prepared: Output of prepare_plot_frame for the same column and period; df is then unused
     
     Returns:
         Plotly Figure object
     """
-    if df.empty or column not in df.columns:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available")
-        return fig
-    
-    # Ensure date column is datetime
-    if "date" not in df.columns:
-        return go.Figure().add_annotation(text="Missing 'date' column")
-    
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df = df.dropna(subset=["date"])
-    
-    # Filter by period
-    today = dt.datetime.now().date()
-    if period == "week":
-        start_date = today - dt.timedelta(days=7)
-    elif period == "month":
-        start_date = today - dt.timedelta(days=30)
-    elif period == "year":
-        start_date = today - dt.timedelta(days=365)
-    else:
-        start_date = today - dt.timedelta(days=30)
-    
-    df_filtered = df[df["date"].dt.date >= start_date].sort_values("date")
+    if prepared is None:
+        if df.empty or column not in df.columns:
+            return _message_figure("No data available")
+        
+        # Ensure date column is datetime
+        if "date" not in df.columns:
+            return _message_figure("Missing 'date' column")
+        
+        # Filter by period
+        prepared = prepare_plot_frame(df, column, period, today=today, date_col_parsed=date_col_parsed)
+    df_filtered = prepared
     
     if df_filtered.empty:
-        fig = go.Figure()
-        fig.add_annotation(text=f"No data for the last {period}")
-        return fig
-    
-    # Extract values and handle NaN
-    df_filtered = df_filtered.copy()
-    df_filtered[column] = pd.to_numeric(df_filtered[column], errors="coerce")
+        return _message_figure(f"No data for the last {period}")
     
-    # Create complete date range and interpolate missing values
+    # Spread values over the complete date range and interpolate missing days linearly
     date_range = pd.date_range(start=df_filtered["date"].min(), end=df_filtered["date"].max(), freq="D")
-    df_complete = pd.DataFrame({"date": date_range})
-    df_complete = df_complete.merge(df_filtered[["date", column]], on="date", how="left")
-    
-    # Interpolate missing values linearly
-    df_complete[column] = df_complete[column].interpolate(method="linear")
-    
-    # Create figure
-    fig = go.Figure()
-    
-    # Add scatter points for actual measured values
-    fig.add_trace(
-        go.Scatter(
-            x=df_filtered["date"],
-            y=df_filtered[column],
-            mode="markers",
-            marker=dict(size=8, color="rgba(0, 102, 204, 1)"),
-            hovertemplate="<b>%{x|%Y-%m-%d}</b><br>" + column + ": %{y:.2f}<extra></extra>",
-            showlegend=False,
-        )
+    daily = df_filtered.set_index("date")[column]
+    daily = daily[~daily.index.duplicated(keep="last")]
+    line = daily.reindex(date_range).interpolate(method="linear")
+    
+    # Cap the number of points per trace so rendering cost doesn't grow with history length
+    x_measured, y_measured = _downsample(df_filtered["date"], df_filtered[column], max_points)
+    x_line, y_line = _downsample(line.index.to_series(), line, max_points)
+    
+    # Scatter points for actual measured values
+    measured_trace = dict(
+        type=_scatter_type(len(x_measured)),
+        x=x_measured,
+        y=y_measured,
+        mode="markers",
+        marker=dict(size=8, color="rgba(0, 102, 204, 1)"),
+        hovertemplate="<b>%{x|%Y-%m-%d}</b><br>" + column + ": %{y:.2f}<extra></extra>",
+        showlegend=False,
     )
     
-    # Add interpolated line
-    fig.add_trace(
-        go.Scatter(
-            x=df_complete["date"],
-            y=df_complete[column],
-            mode="lines",
-            line=dict(color="rgba(0, 102, 204, 0.6)", width=2),
-            hoverinfo="skip",
-            showlegend=False,
-        )
+    # Interpolated line
+    line_trace = dict(
+        type=_scatter_type(len(x_line)),
+        x=x_line,
+        y=y_line,
+        mode="lines",
+        line=dict(color="rgba(0, 102, 204, 0.6)", width=2),
+        hoverinfo="skip",
+        showlegend=False,
     )
     
     # Calculate y-axis range based on zoom level
     y_values = df_filtered[column].dropna()
     if len(y_values) > 0:
-        y_min = y_values.min()
-        y_max = y_values.max()
+        y_min = float(y_values.min())
+        y_max = float(y_values.max())
         y_range = y_max - y_min if y_max > y_min else 1
         y_center = (y_min + y_max) / 2
         
@@ -128,29 +246,27 @@ def plot_time_series(
         y_high = y_center + y_range_adjusted
     
     # Create weekend shading
-    shapes = []
-    date_range_all = pd.date_range(start=df_complete["date"].min(), end=df_complete["date"].max(), freq="D")
-    for date in date_range_all:
-        if date.weekday() >= 5:  # Saturday (5) and Sunday (6)
-            shapes.append(
-                dict(
-                    type="rect",
-                    xref="x",
-                    yref="paper",
-                    x0=date,
-                    x1=date + pd.Timedelta(days=1),
-                    y0=0,
-                    y1=1,
-                    fillcolor="rgba(200, 200, 200, 0.3)",
-                    line=dict(width=0),
-                )
-            )
+    weekends = date_range[date_range.weekday >= 5]  # Saturday (5) and Sunday (6)
+    shapes = [
+        dict(
+            type="rect",
+            xref="x",
+            yref="paper",
+            x0=start,
+            x1=end,
+            y0=0,
+            y1=1,
+            fillcolor="rgba(200, 200, 200, 0.3)",
+            line=dict(width=0),
+        )
+        for start, end in zip(weekends, weekends + pd.Timedelta(days=1))
+    ]
     
-    # Update layout
+    # Layout
     layout_dict = {
-        "title": title or f"{column} – Last {period.capitalize()}",
-        "xaxis_title": "Date",
-        "yaxis_title": column,
+        "title": dict(text=title or f"{column} – Last {period.capitalize()}"),
+        "xaxis": dict(title=dict(text="Date")),
+        "yaxis": dict(title=dict(text=column)),
         "template": "plotly_white",
         "height": 400,
         "hovermode": "x unified",
@@ -159,11 +275,9 @@ def plot_time_series(
     
     # Set y-axis range based on zoom level
     if len(y_values) > 0:
-        layout_dict["yaxis_range"] = [y_low, y_high]
-    
-    fig.update_layout(**layout_dict)
+        layout_dict["yaxis"]["range"] = [y_low, y_high]
     
-    return fig
+    return _build_figure([measured_trace, line_trace], layout_dict)
 
 
 def plot_activity_calendar(
@@ -172,6 +286,10 @@ def plot_activity_calendar(
     period: T.Literal["week", "month", "year"] = "month",
     title: str = None,
     value_threshold: float = None,
+    *,
+    today: T.Optional[dt.date] = None,
+    date_col_parsed: bool = False,
+    prepared: T.Optional[pd.DataFrame] = None,
 ) -> go.Figure:
     """
     Plot a calendar heatmap showing activity intensity.
@@ -182,85 +300,135 @@ def plot_activity_calendar(
         period: "week", "month", or "year"
         title: Optional custom title
         value_threshold: Optional threshold for binary coloring (positive/negative activity)
+        today: End of the plotted window (defaults to the current date)
+        date_col_parsed: Set if df['date'] is already datetime64, to skip re-parsing it
+        prepared: Output of prepare_plot_frame for the same column and period; df is then unused
     
     Returns:
         Plotly Figure object
     """
-    if df.empty or column not in df.columns:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available")
-        return fig
-    
-    # Ensure date column is datetime
-    if "date" not in df.columns:
-        return go.Figure().add_annotation(text="Missing 'date' column")
-    
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df = df.dropna(subset=["date"])
-    
-    # Filter by period
-    today = dt.datetime.now().date()
-    if period == "week":
-        start_date = today - dt.timedelta(days=7)
-    elif period == "month":
-        start_date = today - dt.timedelta(days=30)
-    elif period == "year":
-        start_date = today - dt.timedelta(days=365)
-    else:
-        start_date = today - dt.timedelta(days=30)
-    
-    df_filtered = df[df["date"].dt.date >= start_date].copy()
+    if prepared is None:
+        if df.empty or column not in df.columns:
+            return _message_figure("No data available")
+        
+        # Ensure date column is datetime
+        if "date" not in df.columns:
+            return _message_figure("Missing 'date' column")
+        
+        # Filter by period
+        prepared = prepare_plot_frame(df, column, period, today=today, date_col_parsed=date_col_parsed)
+    df_filtered = prepared
     
     if df_filtered.empty:
-        fig = go.Figure()
-        fig.add_annotation(text=f"No data for the last {period}")
-        return fig
-    
-    # Convert to numeric
-    df_filtered[column] = pd.to_numeric(df_filtered[column], errors="coerce")
-    
-    # Create week and day columns for calendar layout
-    df_filtered["week"] = df_filtered["date"].dt.isocalendar().week
-    df_filtered["day"] = df_filtered["date"].dt.day_name()
-    df_filtered["date_str"] = df_filtered["date"].dt.strftime("%Y-%m-%d")
-    
-    # Determine colors based on values
-    if value_threshold is not None:
-        # Binary coloring: negative (red) vs positive (green)
-        df_filtered["color"] = df_filtered[column].apply(
-            lambda x: "Negative" if pd.isna(x) or x < value_threshold else "Positive"
-        )
-        color_discrete_map = {"Negative": "#FF6B6B", "Positive": "#51CF66", "No Data": "#E0E0E0"}
-    else:
+        return _message_figure(f"No data for the last {period}")
+    
+    title = title or f"{column} Activity – Last {period.capitalize()}"
+    values = df_filtered[column].to_numpy(dtype=np.float32, na_value=np.nan)
+    size = np.abs(np.nan_to_num(values)) + 1
+    trace_type = _scatter_type(len(df_filtered))
+    # area-scaled markers, with px.scatter's default scaling (size_max=20)
+    marker = dict(sizemode="area", sizeref=size.max() / 20 ** 2)
+    # float32 values print their binary noise (7.099999904...) unless formatted
+    hovertemplate = "%{x|%Y-%m-%d}<br>%{y}<br>" + column + ": %{customdata:.6~g}<extra></extra>"
+    
+    if value_threshold is None:
         # Continuous coloring based on value
-        df_filtered["color"] = df_filtered[column]
-        color_discrete_map = None
-    
-    # Create figure
-    fig = px.scatter(
-        df_filtered,
-        x="date",
-        y="day",
-        size=abs(df_filtered[column].fillna(0)) + 1,
-        color="color" if value_threshold is not None else df_filtered[column],
-        hover_data={"date_str": True, column: True},
-        title=title or f"{column} Activity – Last {period.capitalize()}",
-        color_continuous_scale="RdYlGn" if value_threshold is None else None,
-        color_discrete_map=color_discrete_map if value_threshold is not None else None,
-    )
+        traces = [
+            dict(
+                type=trace_type,
+                x=df_filtered["date"],
+                y=df_filtered["day"],
+                mode="markers",
+                marker=dict(
+                    marker,
+                    size=size,
+                    color=values,
+                    colorscale="RdYlGn",
+                    showscale=True,
+                    colorbar=dict(title=dict(text=column)),
+                ),
+                customdata=values,
+                hovertemplate=hovertemplate,
+                showlegend=False,
+            )
+        ]
+    else:
+        # Binary coloring: negative (red) vs positive (green), one legend entry each
+        labels = np.where(np.isnan(values) | (values < value_threshold), "Negative", "Positive")
+        traces = []
+        for label in pd.unique(labels):
+            rows = labels == label
+            traces.append(
+                dict(
+                    type=trace_type,
+                    x=df_filtered["date"][rows],
+                    y=df_filtered["day"][rows],
+                    mode="markers",
+                    name=label,
+                    legendgroup=label,
+                    showlegend=True,
+                    marker=dict(marker, size=size[rows], color=_THRESHOLD_COLORS[label]),
+                    customdata=values[rows],
+                    hovertemplate=hovertemplate,
+                )
+            )
     
-    fig.update_layout(
+    layout = dict(
+        title=dict(text=title),
         height=400,
-        xaxis_title="Date",
-        yaxis_title="Day of Week",
+        xaxis=dict(title=dict(text="Date"), type="date"),
+        yaxis=dict(
+            title=dict(text="Day of Week"),
+            categoryorder="array",
+            categoryarray=list(_DAY_CATEGORY.categories),
+            autorange="reversed",  # Monday at top, as in the year calendar
+        ),
+        legend=dict(itemsizing="constant"),
         template="plotly_white",
         hovermode="closest",
     )
+    return _build_figure(traces, layout)
+
+
+def _flag_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Truthiness of a column as a bool array; a missing column or value counts as False."""
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    values = df[column]
+    if pd.api.types.is_bool_dtype(values):
+        return values.fillna(False).to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.fillna(0).to_numpy(dtype=bool)
+    return values.map(bool, na_action="ignore").fillna(False).to_numpy(dtype=bool)
+
+
+def _numeric_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Column as float64; a missing column or unparseable value counts as 0."""
+    if column not in df.columns:
+        return np.zeros(len(df))
+    return pd.to_numeric(df[column], errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+
+
+def get_activity_scores(df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized get_activity_score(): one composite activity score per row of df.
     
-    fig.update_xaxes(type="date")
-    
-    return fig
+    Columns that are absent, and values that are missing or unparseable, contribute nothing.
+    """
+    steps = _numeric_column(df, "walking_steps")
+    score = (
+        # Exercise activities (positive)
+        3 * _flag_column(df, "gym")
+        + 2 * _numeric_column(df, "run_km")
+        + np.where(steps > 5000, 2, np.where(steps > 2000, 1, 0))
+        + 2 * _flag_column(df, "morning_exercise")
+        # Meditation (positive)
+        + 1 * _flag_column(df, "meditation")
+        # Negative factors
+        - 2 * _flag_column(df, "compulsive_behavior")
+        - 1 * (_numeric_column(df, "cannabis") > 0)
+    )
+    return pd.Series(score, index=df.index, dtype=np.float64)
 
 
 def get_activity_score(entry: dict) -> float:
@@ -269,44 +437,14 @@ def get_activity_score(entry: dict) -> float:
     
     Combines exercise, steps, and other activity metrics into a single score.
     Returns a value where negative indicates low activity, positive indicates high activity.
+    Single-entry form of get_activity_scores().
     """
     try:
-        score = 0
-        
-        # Exercise activities (positive)
-        if entry.get("gym"):
-            score += 3
-        
-        run_km = float(entry.get("run_km", 0) or 0)
-        score += run_km * 2
-        
-        steps = float(entry.get("walking_steps", 0) or 0)
-        if steps > 5000:
-            score += 2
-        elif steps > 2000:
-            score += 1
-        
-        morning_exercise = entry.get("morning_exercise")
-        if morning_exercise:
-            score += 2
-        
-        # Meditation (positive)
-        if entry.get("meditation"):
-            score += 1
-        
-        # Negative factors
-        compulsive = entry.get("compulsive_behavior")
-        if compulsive:
-            score -= 2
-        
-        cannabis = float(entry.get("cannabis", 0) or 0)
-        if cannabis > 0:
-            score -= 1
-        
-        return score
+        return float(get_activity_scores(pd.DataFrame([entry])).iloc[0])
     except Exception:
         return 0.0
 
+
 def plot_exercise_calendar(
     df: pd.DataFrame,
     column: str,
@@ -331,99 +469,76 @@ def plot_exercise_calendar(
     """
     import calendar as cal
     
-    # Prepare data
-    df_copy = df.copy()
-    df_copy["date"] = pd.to_datetime(df_copy["date"], errors="coerce")
-    df_copy = df_copy.dropna(subset=["date"])
+    # Prepare data as local Series; the caller's frame is read, never copied
+    dates = _parse_dates(df["date"])
     
-    # Convert column to boolean
-    if df_copy[column].dtype == 'object':
-        df_copy["exercise"] = df_copy[column].apply(
+    # Convert column to boolean; text columns (object or nullable "string") hold yes/no answers
+    if pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column]):
+        exercise = df[column].apply(
             lambda x: str(x).lower() in ['true', '1', 'yes'] if pd.notna(x) else False
         )
     else:
-        df_copy["exercise"] = pd.to_numeric(df_copy[column], errors="coerce").fillna(False).astype(bool)
+        numeric = pd.to_numeric(df[column], errors="coerce")
+        # missing counts as no exercise; comparing avoids fillna, whose fill value must suit the dtype
+        exercise = numeric.notna() & (numeric != 0)
     
-    # Create dict for quick lookup: date -> bool
-    exercise_dict = dict(zip(df_copy["date"].dt.date, df_copy["exercise"]))
+    # Day ordinals with exercise, for np.isin lookups; a repeated day takes its last row
+    days = dates.dt.normalize()
+    last_row = (dates.notna() & ~days.duplicated(keep="last")).to_numpy()
+    exercised_days = _day_ordinals(days[last_row & exercise.to_numpy(dtype=bool)])
     
     if period == "month":
-        return _create_month_calendar(exercise_dict, year, month, title)
+        return _create_month_calendar(exercised_days, year, month, title)
     elif period == "week":
-        return _create_week_calendar(exercise_dict, week_start_date, title)
+        return _create_week_calendar(exercised_days, week_start_date, title)
     elif period == "year":
-        return _create_year_calendar(exercise_dict, year, title)
+        return _create_year_calendar(exercised_days, year, title)
 
 
-def _create_month_calendar(exercise_dict: dict, year: int, month: int, title: str) -> go.Figure:
-    """Create a monthly calendar view."""
-    import calendar as cal
-    
-    today = dt.datetime.now().date()
-    if year is None:
-        year = today.year
-    if month is None:
-        month = today.month
-    
-    # Get calendar for this month
-    month_cal = cal.monthcalendar(year, month)
-    month_name = cal.month_name[month]
-    
-    # Create grid data
-    x_positions = []
-    y_positions = []
-    dates = []
-    hover_texts = []
-    colors = []
-    
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    
-    for week_num, week in enumerate(month_cal):
-        for day_num, day in enumerate(week):
-            if day == 0:
-                continue
-            
-            x_positions.append(day_num)
-            y_positions.append(-week_num)
-            
-            date_obj = dt.datetime(year, month, day).date()
-            dates.append(date_obj)
-            
-            has_exercise = exercise_dict.get(date_obj, False)
-            hover_texts.append(f"{date_obj}<br>Exercise: {'Yes' if has_exercise else 'No'}")
-            
-            # Green for exercise, light gray for no exercise
-            if has_exercise:
-                colors.append("rgba(76, 175, 80, 0.8)")  # Green
-            else:
-                colors.append("rgba(200, 200, 200, 0.2)")  # Light gray
-    
-    fig = go.Figure()
-    
-    fig.add_trace(
-        go.Scatter(
-            x=x_positions,
-            y=y_positions,
-            mode="markers+text",
-            marker=dict(
-                size=35,
-                color=colors,
-                opacity=0.7,
-                line=dict(width=1, color="rgba(100, 100, 100, 0.3)")
-            ),
-            text=[d.strftime("%d") for d in dates],
-            textposition="middle center",
-            textfont=dict(size=14, color="black"),
-            hovertext=hover_texts,
-            hoverinfo="text",
-            showlegend=False
-        )
+def _day_ordinals(dates: T.Union[pd.Series, pd.DatetimeIndex]) -> np.ndarray:
+    """Proleptic ordinals (as date.toordinal()) of datetime64 values, as an int64 array."""
+    return dates.to_numpy().astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+
+
+_DAY_ABBRS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+_EXERCISE_COLOR = "rgba(76, 175, 80, 0.8)"  # Green
+_NO_EXERCISE_COLOR = "rgba(200, 200, 200, 0.2)"  # Light gray
+
+
+def _calendar_trace(
+    days: pd.DatetimeIndex,
+    exercised_days: np.ndarray,
+    x: T.Sequence,
+    y: T.Sequence,
+    marker: dict,
+    no_exercise_color: str = _NO_EXERCISE_COLOR,
+    **trace,
+) -> dict:
+    """Scatter trace with one marker per day, coloured and hover-labelled by whether it had exercise."""
+    has_exercise = np.isin(_day_ordinals(days), exercised_days)
+    hover_texts = [
+        f"{day}<br>Exercise: {answer}"
+        for day, answer in zip(np.datetime_as_string(days.to_numpy(), unit="D"), np.where(has_exercise, "Yes", "No"))
+    ]
+    return dict(
+        type=_scatter_type(len(days)),
+        x=x,
+        y=y,
+        marker=dict(marker, color=np.where(has_exercise, _EXERCISE_COLOR, no_exercise_color).tolist()),
+        hovertext=hover_texts,
+        hoverinfo="text",
+        showlegend=False,
+        **trace,
     )
-    
-    fig.update_layout(
+
+
+def _weekday_grid_layout(height: int) -> dict:
+    """Layout for the month and week views: weekday columns on top, no y axis."""
+    return dict(
         xaxis=dict(
             tickvals=list(range(7)),
-            ticktext=day_names,
+            ticktext=_DAY_ABBRS,
             showgrid=False,
             zeroline=False,
             side="top",
@@ -434,16 +549,43 @@ def _create_month_calendar(exercise_dict: dict, year: int, month: int, title: st
             zeroline=False,
         ),
         template="plotly_white",
-        height=400,
+        height=height,
         showlegend=False,
         hovermode="closest",
         margin=dict(l=50, r=50, t=80, b=50)
     )
+
+
+def _create_month_calendar(exercised_days: np.ndarray, year: int, month: int, title: str) -> go.Figure:
+    """Create a monthly calendar view."""
+    import calendar as cal
     
-    return fig
+    today = dt.datetime.now().date()
+    if year is None:
+        year = today.year
+    if month is None:
+        month = today.month
+    
+    # One cell per day: columns are weekdays, rows are Monday-based weeks
+    first_weekday, n_days = cal.monthrange(year, month)
+    days = pd.date_range(dt.date(year, month, 1), periods=n_days, freq="D")
+    grid_offsets = first_weekday + np.arange(n_days)  # cells from the Monday before the 1st
+    
+    trace = _calendar_trace(
+        days,
+        exercised_days,
+        x=(grid_offsets % 7).tolist(),
+        y=(-(grid_offsets // 7)).tolist(),
+        marker=dict(size=35, opacity=0.7, line=dict(width=1, color="rgba(100, 100, 100, 0.3)")),
+        mode="markers+text",
+        text=days.strftime("%d").tolist(),
+        textposition="middle center",
+        textfont=dict(size=14, color="black"),
+    )
+    return _build_figure([trace], _weekday_grid_layout(height=400))
 
 
-def _create_week_calendar(exercise_dict: dict, week_start_date: dt.datetime, title: str) -> go.Figure:
+def _create_week_calendar(exercised_days: np.ndarray, week_start_date: dt.datetime, title: str) -> go.Figure:
     """Create a weekly calendar view."""
     if week_start_date is None:
         today = dt.datetime.now().date()
@@ -452,140 +594,43 @@ def _create_week_calendar(exercise_dict: dict, week_start_date: dt.datetime, tit
     elif isinstance(week_start_date, dt.datetime):
         week_start_date = week_start_date.date()
     
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    
-    x_positions = []
-    y_positions = []
-    dates = []
-    hover_texts = []
-    colors = []
-    
-    for i in range(7):
-        date_obj = week_start_date + dt.timedelta(days=i)
-        x_positions.append(i)
-        y_positions.append(0)
-        dates.append(date_obj)
-        
-        has_exercise = exercise_dict.get(date_obj, False)
-        hover_texts.append(f"{date_obj}<br>Exercise: {'Yes' if has_exercise else 'No'}")
-        
-        if has_exercise:
-            colors.append("rgba(76, 175, 80, 0.8)")  # Green
-        else:
-            colors.append("rgba(200, 200, 200, 0.2)")  # Light gray
-    
-    fig = go.Figure()
-    
-    fig.add_trace(
-        go.Scatter(
-            x=x_positions,
-            y=[0] * 7,
-            mode="markers+text",
-            marker=dict(
-                size=50,
-                color=colors,
-                opacity=0.7,
-                line=dict(width=1, color="rgba(100, 100, 100, 0.3)")
-            ),
-            text=[d.strftime("%d") for d in dates],
-            textposition="middle center",
-            textfont=dict(size=16, color="black"),
-            hovertext=hover_texts,
-            hoverinfo="text",
-            showlegend=False
-        )
+    days = pd.date_range(week_start_date, periods=7, freq="D")
+    
+    trace = _calendar_trace(
+        days,
+        exercised_days,
+        x=list(range(7)),
+        y=[0] * 7,
+        marker=dict(size=50, opacity=0.7, line=dict(width=1, color="rgba(100, 100, 100, 0.3)")),
+        mode="markers+text",
+        text=days.strftime("%d").tolist(),
+        textposition="middle center",
+        textfont=dict(size=16, color="black"),
     )
-    
-    week_end = week_start_date + dt.timedelta(days=6)
-    week_number = week_start_date.isocalendar()[1]
-    year = week_start_date.isocalendar()[0]
-    
-    fig.update_layout(
-        xaxis=dict(
-            tickvals=list(range(7)),
-            ticktext=day_names,
-            showgrid=False,
-            zeroline=False,
-            side="top",
-        ),
-        yaxis=dict(
-            showticklabels=False,
-            showgrid=False,
-            zeroline=False,
-        ),
-        template="plotly_white",
-        height=250,
-        showlegend=False,
-        hovermode="closest",
-        margin=dict(l=50, r=50, t=80, b=50)
-    )
-    
-    return fig
+    return _build_figure([trace], _weekday_grid_layout(height=250))
 
 
-def _create_year_calendar(exercise_dict: dict, year: int, title: str) -> go.Figure:
+def _create_year_calendar(exercised_days: np.ndarray, year: int, title: str) -> go.Figure:
     """Create a yearly calendar heatmap view."""
-    import calendar as cal
-    
     if year is None:
         year = dt.datetime.now().year
     
-    # Create data for heatmap
-    weeks_data = []
-    day_of_week_data = []
-    dates_list = []
-    hover_texts = []
-    colors = []
-    
-    # Iterate through all days of the year
-    start_date = dt.datetime(year, 1, 1).date()
-    end_date = dt.datetime(year, 12, 31).date()
-    
-    current = start_date
-    week_num = 0
-    
-    while current <= end_date:
-        has_exercise = exercise_dict.get(current, False)
-        
-        weeks_data.append(current.isocalendar()[1])  # Week number
-        day_of_week_data.append(current.weekday())  # Day of week (0=Mon, 6=Sun)
-        dates_list.append(current)
-        
-        hover_texts.append(f"{current}<br>Exercise: {'Yes' if has_exercise else 'No'}")
-        
-        if has_exercise:
-            colors.append(1)  # Exercise
-        else:
-            colors.append(0)  # No exercise
-        
-        current += dt.timedelta(days=1)
-    
-    # Create scatter plot for year view
-    fig = go.Figure()
-    
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    
-    fig.add_trace(
-        go.Scatter(
-            x=weeks_data,
-            y=day_of_week_data,
-            mode="markers",
-            marker=dict(
-                size=12,
-                color=colors,
-                colorscale=[[0, "rgba(200, 200, 200, 0.3)"], [1, "rgba(76, 175, 80, 0.8)"]],
-                showscale=False,
-                line=dict(width=0.5, color="rgba(150, 150, 150, 0.3)")
-            ),
-            hovertext=hover_texts,
-            hoverinfo="text",
-            showlegend=False
-        )
+    # Every day of the year: week number across, day of week (0=Mon, 6=Sun) down
+    days = pd.date_range(dt.date(year, 1, 1), dt.date(year, 12, 31), freq="D")
+    
+    trace = _calendar_trace(
+        days,
+        exercised_days,
+        x=days.isocalendar()["week"].to_numpy(dtype=np.int64).tolist(),
+        y=days.weekday.tolist(),
+        marker=dict(size=12, line=dict(width=0.5, color="rgba(150, 150, 150, 0.3)")),
+        no_exercise_color="rgba(200, 200, 200, 0.3)",
+        mode="markers",
     )
     
-    fig.update_layout(
+    layout = dict(
         xaxis=dict(
-            title="Week Number",
+            title=dict(text="Week Number"),
             showgrid=False,
             side="top",
             zeroline=False,
@@ -594,7 +639,7 @@ def _create_year_calendar(exercise_dict: dict, year: int, title: str) -> go.Figu
         ),
         yaxis=dict(
             tickvals=list(range(7)),
-            ticktext=day_names,
+            ticktext=_DAY_ABBRS,
             showgrid=False,
             scaleanchor="x",
             scaleratio=1,
@@ -608,4 +653,4 @@ def _create_year_calendar(exercise_dict: dict, year: int, title: str) -> go.Figu
         margin=dict(l=80, r=50, t=80, b=50)
     )
     
-    return fig
\ No newline at end of file
+    return _build_figure([trace], layout)
@@ -1,3 +1,6 @@
+import re
+from functools import lru_cache
+
 import streamlit as st
 
 
@@ -9,7 +12,24 @@ def apply_ios_style(
     expander_bg: str = "rgba(0, 122, 255, 0.12)",
     max_width: int = 1100,
 ):
+    # emitted on every rerun (Streamlit drops elements a run doesn't re-create), so keep it small
     st.markdown(
+        _ios_css(font_size, primary_color, secondary_color, app_bg, expander_bg, max_width),
+        unsafe_allow_html=True,
+    )
+
+
+@lru_cache(maxsize=8)
+def _ios_css(
+    font_size: int,
+    primary_color: str,
+    secondary_color: str,
+    app_bg: str,
+    expander_bg: str,
+    max_width: int,
+) -> str:
+    """The style block for these settings, formatted and minified once."""
+    return _minify_css(
         f"""
         <style>
         html, body, [class*="css"] {{
@@ -91,6 +111,11 @@ def apply_ios_style(
             box-shadow: 0 0 0 6px rgba(0, 122, 255, 0.2) !important;
         }}
         </style>
-        """,
-        unsafe_allow_html=True,
+        """
     )
+
+
+def _minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)  # comments
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};])\s*", r"\1", css).strip()
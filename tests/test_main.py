@@ -0,0 +1,117 @@
+import datetime as dt
+import math
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+import main
+
+BLOCKS = [{
+    "fields": [
+        {"name": "sleep_hours", "type": "number"},
+        {"name": "gym", "type": "checkbox"},
+        {"name": "mood_word", "type": "select", "options": ["good", "bad"]},
+        {"name": "wake_time", "type": "time"},
+    ],
+}]
+DTYPES = main.build_dtype_map(BLOCKS)
+
+# as written by the original CSV handler: pd.concat of new rows, then to_csv(index=False)
+LEGACY_CSV = (
+    "date,timestamp,sleep_hours,gym,mood_word,wake_time\n"
+    "2026-01-01,2026-01-01 00:00:00,7.5,True,good,07:30:00\n"
+    "2026-01-02,2026-01-02 00:00:00,,False,,\n"
+)
+
+
+class DataHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        # saves less than a clock tick apart can share an mtime, the cache key of the loader
+        main._load_cached.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _handler(self, name):
+        return main.WellnessDataHandler(os.path.join(self.dir, name), dtypes=DTYPES)
+
+    def _upsert(self, handler, day, updates):
+        main._load_cached.clear()
+        handler.upsert_for_date(day, updates)
+        main._load_cached.clear()
+
+    def test_csv_new_day_is_appended(self):
+        h = self._handler("data.csv")
+        self._upsert(h, "2026-01-01", {"sleep_hours": 7.0, "gym": True})
+        with open(h.filename) as f:
+            before = f.read()
+        self._upsert(h, "2026-01-02", {"sleep_hours": 6.5, "gym": False})
+        with open(h.filename) as f:
+            after = f.read()
+        self.assertTrue(after.startswith(before))
+        self.assertEqual(after[len(before):].count("\n"), 1)
+        self.assertEqual(h.get_for_date("2026-01-02")["sleep_hours"], 6.5)
+        self.assertEqual(len(h.load_data()), 2)
+
+    def test_csv_new_column_rewrites_file(self):
+        h = self._handler("data.csv")
+        self._upsert(h, "2026-01-01", {"sleep_hours": 7.0})
+        self._upsert(h, "2026-01-02", {"sleep_hours": 6.5, "mood_word": "good"})
+        self.assertIn("mood_word", pd.read_csv(h.filename, nrows=0).columns)
+        self.assertEqual(h.get_for_date("2026-01-02")["mood_word"], "good")
+        self.assertTrue(pd.isna(h.get_for_date("2026-01-01")["mood_word"]))
+
+    def test_update_with_missing_values(self):
+        for name in ("data.csv", "data.parquet"):
+            with self.subTest(name=name):
+                h = self._handler(name)
+                self._upsert(h, "2026-01-01", {"sleep_hours": 7.0, "gym": True})
+                self._upsert(h, "2026-01-01", {"sleep_hours": None, "gym": None})
+                self._upsert(h, "2026-01-01", {"sleep_hours": float("nan"), "gym": True})
+                row = h.get_for_date("2026-01-01")
+                self.assertTrue(math.isnan(row["sleep_hours"]))
+                self.assertTrue(bool(row["gym"]))
+                self.assertEqual(len(h.load_data()), 1)
+
+    def test_parquet_round_trip(self):
+        h = self._handler("data.parquet")
+        self._upsert(h, "2026-01-01", {
+            "sleep_hours": 7.5, "gym": True, "mood_word": "good", "wake_time": dt.time(7, 30),
+        })
+        self._upsert(h, "2026-01-02", {"sleep_hours": 6.0, "gym": False, "mood_word": "bad"})
+        df = h.load_data()
+        self.assertEqual(df["sleep_hours"].dtype, "float64")
+        self.assertEqual(df["gym"].dtype, "boolean")
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["timestamp"]))
+        row = h.get_for_date("2026-01-01")
+        self.assertEqual((row["sleep_hours"], bool(row["gym"]), row["mood_word"]), (7.5, True, "good"))
+        self.assertEqual(row["wake_time"], "07:30:00")
+
+    def test_legacy_csv_migration(self):
+        with open(os.path.join(self.dir, "data.csv"), "w") as f:
+            f.write(LEGACY_CSV)
+        h = self._handler("data.parquet")
+        self.assertTrue(os.path.exists(h.filename))
+        df = h.load_data()
+        self.assertEqual(sorted(df.index), ["2026-01-01", "2026-01-02"])
+        row = h.get_for_date("2026-01-01")
+        self.assertEqual((row["sleep_hours"], bool(row["gym"]), row["wake_time"]), (7.5, True, "07:30:00"))
+        self._upsert(h, "2026-01-02", {"sleep_hours": 8.0, "gym": True})
+        self.assertEqual(h.get_for_date("2026-01-02")["sleep_hours"], 8.0)
+
+    def test_legacy_cell_that_does_not_parse(self):
+        with open(os.path.join(self.dir, "data.csv"), "w") as f:
+            f.write(LEGACY_CSV.replace(",7.5,", ",abc,"))
+        h = self._handler("data.parquet")
+        self._upsert(h, "2026-01-01", {"sleep_hours": 8.0})
+        self._upsert(h, "2026-01-03", {"sleep_hours": 6.5})
+        self.assertEqual(h.get_for_date("2026-01-01")["sleep_hours"], 8.0)
+        self.assertEqual(len(h.load_data()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
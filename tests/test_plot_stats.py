@@ -0,0 +1,34 @@
+import unittest
+
+import pandas as pd
+
+import plot_stats
+
+EXERCISE_COLOR = "rgba(76, 175, 80, 0.8)"
+
+
+class PlotExerciseCalendarTest(unittest.TestCase):
+    def _exercised_count(self, values, dtype):
+        df = pd.DataFrame({
+            "date": pd.Series(["2026-02-02", "2026-02-03", "2026-02-04"], dtype="string"),
+            "gym": pd.Series(values, dtype=dtype),
+        })
+        fig = plot_stats.plot_exercise_calendar(df, "gym", period="month", year=2026, month=2)
+        return list(fig.data[0].marker.color).count(EXERCISE_COLOR)
+
+    def test_string_column(self):
+        # select fields are stored as nullable "string"
+        self.assertEqual(self._exercised_count(["yes", "no", None], "string"), 1)
+
+    def test_object_column(self):
+        self.assertEqual(self._exercised_count(["yes", "no", None], object), 1)
+
+    def test_boolean_column(self):
+        self.assertEqual(self._exercised_count([True, False, None], "boolean"), 1)
+
+    def test_nullable_float_column(self):
+        self.assertEqual(self._exercised_count([1.0, 0.0, None], "Float64"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()